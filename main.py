@@ -1,6 +1,192 @@
-import xml.etree.ElementTree as ET
 import json
+import mmap
 import os
+import stat
+from collections import Counter, defaultdict
+
+try:
+    from lxml import etree as ET  # Парсер на основе libxml2 (необязательная зависимость)
+    _XML_PARSE_ERRORS = (ET.XMLSyntaxError, ET.ParseError)
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _XML_PARSE_ERRORS = (ET.ParseError,)
+
+try:
+    import orjson  # Быстрая сериализация JSON (необязательная зависимость)
+except ImportError:
+    orjson = None
+
+_WRITE_BUFFER_SIZE = 1024 * 1024  # Размер буфера записи выходных файлов (1 МиБ)
+_XML_ATTRIBUTE_TEMPLATE = "%s    <%s>%s</%s>\n"  # Строка атрибута в config.xml: отступ, имя, тип, имя
+_MISSING = object()  # Маркер отсутствующего ключа, отличимый от любого значения JSON
+
+
+class _NonFiniteFloat(float):
+    """
+    Значение NaN/Infinity из входного JSON.
+
+    orjson записывает такие числа как null, поэтому документы с ними сериализуются модулем json.
+    """
+
+
+def _json_loads(data):
+    """
+    Разбирает JSON из строки или байтов.
+
+    Разбор всегда выполняется модулем json: orjson без ошибок превращает целые числа шире 64 бит
+    в float и отвергает NaN/Infinity, поэтому результат зависел бы от установленных пакетов.
+
+    Args:
+        data (str | bytes): Содержимое JSON файла.
+
+    Returns:
+        object: Разобранные данные.
+    """
+
+    return json.loads(data, parse_constant=_NonFiniteFloat)
+
+
+def _read_json_file(path):
+    """
+    Читает и разбирает JSON файл.
+
+    Обычные непустые файлы отображаются в память через mmap, каналы, FIFO и пустые файлы
+    читаются целиком через read().
+
+    Args:
+        path (str): Путь к JSON файлу.
+
+    Returns:
+        object: Разобранные данные.
+    """
+
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        # Каналы и FIFO сообщают нулевой размер даже с данными, а пустой файл нельзя отобразить в память
+        if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+            return _json_loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _json_loads(mm[:])
+
+
+def _json_dumps(obj):
+    """
+    Сериализует объект в JSON с отступом в 2 пробела, используя orjson при его наличии.
+
+    Если orjson не может точно записать данные (целые числа вне 64-битного диапазона, NaN/Infinity),
+    используется модуль json.
+
+    Args:
+        obj (object): Данные для сериализации.
+
+    Returns:
+        bytes: JSON в кодировке UTF-8.
+    """
+
+    if orjson is not None:
+        try:
+            # _NonFiniteFloat не передается orjson как float, а вызывает ошибку сериализации
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_SUBCLASS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _blank_class():
+    """
+    Создает пустую запись о классе модели.
+
+    Returns:
+        dict: Информация о классе без документации, атрибутов и агрегаций.
+    """
+
+    return {
+        "isRoot": False,
+        "documentation": None,
+        "attributes": [],  # Список атрибутов класса
+        "aggregations": []  # Список агрегаций класса
+    }
+
+
+def _iter_json_list(items, level=0):
+    """
+    Сериализует JSON массив поэлементно, не собирая весь массив в памяти.
+
+    Объединение фрагментов совпадает с _json_dumps() для того же списка, вложенного на уровень level.
+
+    Args:
+        items (Iterable): Элементы массива.
+        level (int): Уровень вложенности массива в документе.
+
+    Yields:
+        bytes: Фрагменты JSON в кодировке UTF-8.
+    """
+
+    item_indent = b"\n" + b"  " * (level + 1)
+    separator = b"["
+    for item in items:
+        yield separator
+        yield item_indent
+        yield _json_dumps(item).replace(b"\n", item_indent)  # Сдвигаем элемент на его уровень вложенности
+        separator = b","
+
+    if separator == b"[":  # Пустой массив
+        yield b"[]"
+    else:
+        yield b"\n" + b"  " * level + b"]"
+
+
+def _write_all(fd, data):
+    """
+    Записывает данные в файловый дескриптор целиком, повторяя os.write() при частичной записи.
+
+    Args:
+        fd (int): Файловый дескриптор, открытый на запись.
+        data (bytes | bytearray | memoryview): Данные для записи.
+    """
+
+    view = memoryview(data)
+    total = len(view)
+    written = 0
+    while written < total:
+        written += os.write(fd, view[written:])
+
+
+def _write_file(path, chunks, buffer):
+    """
+    Записывает фрагменты в файл через заранее выделенный буфер напрямую в файловый дескриптор.
+
+    Фрагменты копируются в буфер, который сбрасывается одним вызовом os.write() при заполнении.
+    Фрагмент, не меньший буфера, записывается напрямую без копирования.
+
+    Args:
+        path (str): Путь к выходному файлу.
+        chunks (Iterable[bytes]): Фрагменты содержимого файла.
+        buffer (bytearray): Буфер записи, общий для всех выходных файлов.
+
+    Raises:
+        OSError: Если файл не удалось открыть или записать.
+    """
+
+    # O_BINARY (только Windows) отключает текстовый режим CRT с заменой \n на \r\n
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        size = len(buffer)
+        filled = 0
+        with memoryview(buffer) as view:
+            for chunk in chunks:
+                length = len(chunk)
+                if filled + length > size:
+                    _write_all(fd, view[:filled])
+                    filled = 0
+                    if length >= size:
+                        _write_all(fd, chunk)
+                        continue
+                view[filled:filled + length] = chunk
+                filled += length
+            _write_all(fd, view[:filled])
+    finally:
+        os.close(fd)
 
 
 class ArtifactGenerator:
@@ -23,6 +209,11 @@ class ArtifactGenerator:
         self.patched_config_file = patched_config_file
         self.classes = {}  # Словарь для хранения информации о классах (имя класса -> информация о классе)
         self.root_class_name = None  # Имя корневого класса
+        self._element_cache = {}  # Кэш XML элементов классов: (имя класса, отступ) -> XML строка
+        self._out_buf = bytearray(_WRITE_BUFFER_SIZE)  # Буфер записи, общий для всех выходных файлов
+        self.config_data = None  # Исходная конфигурация, загруженная в load_configs()
+        self.patched_config_data = None  # Измененная конфигурация, загруженная в load_configs()
+        self.delta = None  # Дельта, вычисленная в generate_delta_json()
 
     def load_xml(self):
         """
@@ -33,48 +224,97 @@ class ArtifactGenerator:
         """
 
         try:
-            tree = ET.parse(self.xml_file)
-            root = tree.getroot()
+            classes = {}  # Модель собирается в локальных переменных и сохраняется только после успешного разбора
+            root_class_name = None
+            aggregations_by_source = defaultdict(list)  # Агрегации, сгруппированные по классу-источнику
+            root = None
+            depth = 0  # Глубина текущего элемента: 1 - корень документа, 2 - его прямые потомки
+
+            # Потоковый разбор: обрабатываются только прямые потомки корня, каждый из них
+            # удаляется из дерева сразу после закрывающего тега
+            for event, element in ET.iterparse(self.xml_file, events=("start", "end")):
+                if event == "start":
+                    depth += 1
+                    if root is None:
+                        root = element
+                    continue
+
+                depth -= 1  # После закрывающего тега depth равна глубине родителя элемента
+                if depth != 1:  # Вложенные элементы обрабатываются вместе со своим предком
+                    continue
 
-            for element in root:
                 if element.tag == "Class":
-                    class_name = element.get("name")
-                    is_root = element.get("isRoot") == "true"
-                    documentation = element.get("documentation")
-                    self.classes[class_name] = {
-                        "isRoot": is_root,
-                        "documentation": documentation,
-                        "attributes": [],  # Список атрибутов класса
-                        "aggregations": []  # Список агрегаций класса
-                    }
+                    element_attrs = element.attrib  # Атрибуты элемента читаются из одного словаря
+                    class_name = element_attrs.get("name")
+                    is_root = element_attrs.get("isRoot") == "true"
+                    documentation = element_attrs.get("documentation")
+                    # Повторное объявление класса дополняет уже разобранную запись, а не заменяет ее
+                    class_data = classes.setdefault(class_name, _blank_class())
+                    class_data["isRoot"] = class_data["isRoot"] or is_root
+                    # Пустая документация не затирает заданную ранее
+                    if documentation or class_data["documentation"] is None:
+                        class_data["documentation"] = documentation
+                    attributes = class_data["attributes"]
                     if is_root:
-                        self.root_class_name = class_name
+                        root_class_name = class_name
 
-                    for attribute in element:
-                        if attribute.tag == "Attribute":
-                            attr_name = attribute.get("name")
-                            attr_type = attribute.get("type")
-                            self.classes[class_name]["attributes"].append(
-                                {"name": attr_name, "type": attr_type})
+                    for attribute in element.iterfind("Attribute"):
+                        attribute_attrs = attribute.attrib
+                        attributes.append({"name": attribute_attrs.get("name"), "type": attribute_attrs.get("type")})
 
                 elif element.tag == "Aggregation":
-                    source = element.get("source")
-                    target = element.get("target")
-                    source_multiplicity = element.get("sourceMultiplicity")
-                    target_multiplicity = element.get("targetMultiplicity")
-                    self.classes[source]["aggregations"].append({
-                        "target": target,
-                        "sourceMultiplicity": source_multiplicity,
-                        "targetMultiplicity": target_multiplicity
+                    element_attrs = element.attrib
+                    aggregations_by_source[element_attrs.get("source")].append({
+                        "target": element_attrs.get("target"),
+                        "sourceMultiplicity": element_attrs.get("sourceMultiplicity"),
+                        "targetMultiplicity": element_attrs.get("targetMultiplicity")
                     })
-        except FileNotFoundError:  # Обработка исключения, если файл не найден
+
+                root.clear()  # Освобождаем обработанный элемент вместе с дочерними, чтобы память не росла
+
+            # Присоединяем агрегации после разбора, поэтому порядок Class/Aggregation в файле не важен
+            for class_name, class_data in classes.items():
+                class_data["aggregations"] = aggregations_by_source.get(class_name, [])
+            for source in aggregations_by_source:  # Порядок сообщений совпадает с порядком в файле
+                if source not in classes:
+                    print(f"Ошибка: Класс-источник агрегации '{source}' не объявлен, его агрегации пропущены.")
+        except OSError:  # Обработка исключения, если файл не найден (lxml сообщает об этом через OSError)
             print(f"Ошибка: XML файл '{self.xml_file}' не найден.")
             return False
-        except ET.ParseError:  # Обработка исключения, если не удалось распарсить XML файл
+        except _XML_PARSE_ERRORS:  # Обработка исключения, если не удалось распарсить XML файл
             print(f"Ошибка: Не удалось распарсить XML файл '{self.xml_file}'.")
             return False
+
+        self.classes = classes  # Повторная загрузка заменяет модель, а не дополняет ее
+        self.root_class_name = root_class_name
         return True  # Возвращаем True, если все прошло успешно
 
+    def load_configs(self):
+        """
+        Загружает исходную и измененную конфигурации из JSON файлов.
+
+        Файлы читаются один раз, далее generate_delta_json() и generate_res_patched_config_json()
+        работают с данными в памяти.
+
+        Returns:
+            bool: True, если загрузка прошла успешно, False - иначе.
+        """
+
+        try:
+            config_data = _read_json_file(self.config_file)
+            patched_config_data = _read_json_file(self.patched_config_file)
+        except FileNotFoundError as e:
+            print(f"Ошибка: Файл конфигурации не найден: {e}")
+            return False
+        except json.JSONDecodeError as e:
+            print(f"Ошибка: Некорректный формат JSON в файле конфигурации: {e}")
+            return False
+
+        self.config_data = config_data
+        self.patched_config_data = patched_config_data
+        self.delta = None  # Дельта, вычисленная для предыдущих конфигураций, больше не актуальна
+        return True
+
     def generate_config_xml(self, output_file="out/config.xml"):
         """
         Генерирует файл config.xml на основе загруженной модели.
@@ -90,48 +330,88 @@ class ArtifactGenerator:
             print("Ошибка: XML данные не загружены. Сначала вызовите load_xml().")
             return False
 
-        def create_element(class_name, indent=1):
+        def create_element(class_name, indent, out):
             """
-            Рекурсивная функция для создания XML элемента для класса.
+            Создает XML элемент для класса вместе со всеми вложенными классами.
+
+            Обход выполняется явным стеком вместо рекурсии, поэтому глубина модели
+            не ограничена лимитом рекурсии интерпретатора. Поддерево класса, на который
+            ссылаются несколько агрегаций, строится один раз для каждого уровня отступа
+            и далее берется из кэша. Остальные поддеревья не кэшируются, чтобы длинные
+            цепочки агрегаций не хранили в памяти все свои вложенные фрагменты.
 
             Args:
                 class_name (str): Имя класса.
                 indent (int): Уровень отступа.
+                out (list): Список, в который добавляются фрагменты XML строки.
 
             Returns:
-                str: XML строка, представляющая элемент.
+                bool: True, если элемент построен, False - если в агрегациях обнаружен цикл.
             """
 
-            indent_str = "    " * indent
-            element_str = f"{indent_str}<{class_name}>\n"
-            class_data = self.classes[class_name]
-            for attribute in class_data["attributes"]:
-                element_str += f"{indent_str}    <{attribute['name']}>{attribute['type']}</{attribute['name']}>\n"
-
-            for aggregation in class_data["aggregations"]:
-                target_class = aggregation["target"]
-                element_str += create_element(target_class, indent + 1)
-
-            element_str += f"{indent_str}</{class_name}>\n"
-            return element_str
-
+            path = set()  # Классы, элементы которых открыты, но еще не закрыты
+            # Элементы стека: (имя класса, отступ, None) - открыть элемент,
+            # (имя класса, отступ, начало фрагмента в out) - закрыть элемент
+            stack = [(class_name, indent, None)]
+            while stack:
+                name, level, start = stack.pop()
+                indent_str = "    " * level
+
+                if start is not None:
+                    path.discard(name)
+                    out.append(f"{indent_str}</{name}>\n")
+                    if name in shared_classes:
+                        self._element_cache[(name, level)] = "".join(out[start:])
+                    continue
+
+                cached = self._element_cache.get((name, level))
+                if cached is not None:
+                    out.append(cached)
+                    continue
+
+                if name in path:
+                    print(f"Ошибка: Обнаружена циклическая агрегация для класса '{name}'.")
+                    return False
+                path.add(name)
+
+                class_data = self.classes[name]
+                attributes = class_data["attributes"]
+                aggregations = class_data["aggregations"]
+
+                stack.append((name, level, len(out)))
+                out.append(f"{indent_str}<{name}>\n")
+                for attribute in attributes:
+                    attr_name = attribute["name"]
+                    out.append(_XML_ATTRIBUTE_TEMPLATE % (indent_str, attr_name, attribute["type"], attr_name))
+
+                for aggregation in reversed(aggregations):  # В обратном порядке, чтобы снимать со стека по порядку
+                    stack.append((aggregation["target"], level + 1, None))
+
+            return True
+
+        self._element_cache.clear()  # Модель могла измениться после предыдущего вызова load_xml()
+        target_counts = Counter(aggregation["target"]
+                                for class_data in self.classes.values()
+                                for aggregation in class_data["aggregations"])
+        shared_classes = {name for name, count in target_counts.items() if count > 1}
         root_element_name = self.root_class_name
-        xml_content = f"<{root_element_name}>\n"
         root_class_data = self.classes[self.root_class_name]
+        parts = [f"<{root_element_name}>\n"]  # Фрагменты XML, объединяемые в строку в конце
 
         for attribute in root_class_data["attributes"]:
-            xml_content += f"    <{attribute['name']}>{attribute['type']}</{attribute['name']}>\n"
+            attr_name = attribute["name"]
+            parts.append(_XML_ATTRIBUTE_TEMPLATE % ("", attr_name, attribute["type"], attr_name))
 
         for aggregation in root_class_data["aggregations"]:
             target_class = aggregation["target"]
-            xml_content += create_element(target_class, 1)
+            if not create_element(target_class, 1, parts):
+                return False
 
-        xml_content += f"</{root_element_name}>\n"
+        parts.append(f"</{root_element_name}>\n")
+        xml_content = "".join(parts).encode("utf-8")
 
         try:
-            with open(output_file,
-                      "w") as f:
-                f.write(xml_content)
+            _write_file(output_file, (xml_content,), self._out_buf)
             print(f"config.xml сгенерирован успешно.")
         except IOError:
             print(f"Ошибка: Не удалось записать в файл '{output_file}'.")
@@ -154,42 +434,42 @@ class ArtifactGenerator:
             print("Ошибка: XML данные не загружены. Сначала вызовите load_xml().")
             return False
 
-        meta_data = []  # Список для хранения мета-информации о классах
-        for class_name, class_data in self.classes.items():
-            class_info = {  # Создаем словарь с информацией о классе
-                "class": class_name,
-                "documentation": class_data["documentation"],
-                "isRoot": class_data["isRoot"],
-                "parameters": []
-            }
-
-            min_multiplicity = None
-            max_multiplicity = None
-
-            for agg_data in self.classes[class_name]["aggregations"]:
-                multiplicity = agg_data["sourceMultiplicity"]
-                if ".." in multiplicity:
-                    min_multiplicity, max_multiplicity = multiplicity.split("..")
-                else:
-                    min_multiplicity = max_multiplicity = multiplicity
-                break
-
-            if min_multiplicity:
-                class_info["min"] = min_multiplicity
-            if max_multiplicity:
-                class_info["max"] = max_multiplicity
-
-            for attribute in class_data["attributes"]:
-                class_info["parameters"].append({"name": attribute["name"], "type": attribute["type"]})
-
-            for aggregation in class_data["aggregations"]:
-                target_class = aggregation["target"]
-                class_info["parameters"].append({"name": target_class, "type": "class"})
-            meta_data.append(class_info)
+        def iter_meta_data():
+            """
+            Генерирует мета-информацию о классах по одному классу за раз.
+
+            Yields:
+                dict: Словарь с информацией о классе.
+            """
+
+            for class_name, class_data in self.classes.items():
+                aggregations = class_data["aggregations"]
+                class_info = {  # Создаем словарь с информацией о классе
+                    "class": class_name,
+                    "documentation": class_data["documentation"],
+                    "isRoot": class_data["isRoot"],
+                    "parameters": [{"name": attribute["name"], "type": attribute["type"]}
+                                   for attribute in class_data["attributes"]]
+                                  + [{"name": aggregation["target"], "type": "class"}
+                                     for aggregation in aggregations]
+                }
+
+                if aggregations:  # Кратность берется из первой агрегации класса
+                    multiplicity = aggregations[0]["sourceMultiplicity"]
+                    if ".." in multiplicity:
+                        min_multiplicity, max_multiplicity = multiplicity.split("..")
+                    else:
+                        min_multiplicity = max_multiplicity = multiplicity
+
+                    if min_multiplicity:
+                        class_info["min"] = min_multiplicity
+                    if max_multiplicity:
+                        class_info["max"] = max_multiplicity
+                yield class_info
 
         try:
-            with open(output_file, "w") as f:
-                json.dump(meta_data, f, indent=4)
+            # В памяти одновременно находится только один класс
+            _write_file(output_file, _iter_json_list(iter_meta_data()), self._out_buf)
             print(f"meta.json сгенерирован успешно.")
         except IOError:
             print(f"Ошибка: Не удалось записать в файл '{output_file}'.")
@@ -201,6 +481,8 @@ class ArtifactGenerator:
         """
         Генерирует файл delta.json, содержащий разницу между config.json и patched_config.json.
 
+        Если конфигурации еще не загружены, вызывается load_configs().
+
         Args:
             output_file (str): Имя выходного файла.
 
@@ -208,41 +490,31 @@ class ArtifactGenerator:
             bool: True, если генерация прошла успешно, False - иначе.
         """
 
-        try:
-            with open(self.config_file, "r") as f:
-                config_data = json.load(f)
-            with open(self.patched_config_file, "r") as f:
-                patched_config_data = json.load(f)
-        except FileNotFoundError as e:
-            print(f"Ошибка: Файл конфигурации не найден: {e}")
+        if self.config_data is None and not self.load_configs():
             return False
-        except json.JSONDecodeError as e:
-            print(f"Ошибка: Некорректный формат JSON в файле конфигурации: {e}")
-            return False
-
-        additions = []  # Список для хранения добавленных параметров
-        deletions = []  # Список для хранения удаленных параметров
-        updates = []  # Список для хранения измененных параметров
-
-        for key, value in patched_config_data.items():
-            if key not in config_data:
+        config_data = self.config_data
+        patched_config_data = self.patched_config_data
+
+        # Порядок элементов в списках сохраняется таким же, как во входных файлах
+        additions = []  # Список добавленных параметров
+        updates = []  # Список измененных параметров
+        for key, value in patched_config_data.items():  # Добавления и изменения находятся за один проход
+            old_value = config_data.get(key, _MISSING)
+            if old_value is _MISSING:
                 additions.append({"key": key, "value": value})
-            elif config_data[key] != value:
-                updates.append({"key": key, "from": config_data[key], "to": value})
-
-        for key in config_data:
-            if key not in patched_config_data:
-                deletions.append(key)
+            elif old_value != value:
+                updates.append({"key": key, "from": old_value, "to": value})
+        deletions = [key for key in config_data if key not in patched_config_data]  # Список удаленных параметров
 
         delta = {  # Создаем словарь с информацией о дельте
             "additions": additions,
             "deletions": deletions,
             "updates": updates
         }
+        self.delta = delta  # Сохраняем для generate_res_patched_config_json()
 
         try:
-            with open(output_file, "w") as f:
-                json.dump(delta, f, indent=4)
+            _write_file(output_file, (_json_dumps(delta),), self._out_buf)
             print(f"delta.json сгенерирован успешно.")
         except IOError:
             print(f"Ошибка: Не удалось записать в файл '{output_file}'.")
@@ -253,6 +525,9 @@ class ArtifactGenerator:
         """
         Генерирует файл res_patched_config.json, применяя дельту (delta.json) к config.json.
 
+        Используются конфигурация и дельта, уже находящиеся в памяти после generate_delta_json(),
+        поэтому входные файлы повторно не читаются.
+
         Args:
             output_file (str): Имя выходного файла.
 
@@ -260,33 +535,23 @@ class ArtifactGenerator:
             bool: True, если генерация прошла успешно, False - иначе.
         """
 
-        try:
-            with open(self.config_file, "r") as f:
-                config_data = json.load(f)
-            with open("out/delta.json", "r") as f:
-                delta_data = json.load(f)
-        except FileNotFoundError as e:
-            print(f"Ошибка: Файл конфигурации или delta.json не найден: {e}")
-            return False
-        except json.JSONDecodeError as e:
-            print(f"Ошибка: Некорректный формат JSON в файле конфигурации или delta.json: {e}")
+        if self.delta is None:  # Проверяем, что дельта вычислена
+            print("Ошибка: Дельта не вычислена. Сначала вызовите generate_delta_json().")
             return False
+        delta_data = self.delta
 
-        res_patched_config = config_data.copy()  # Создаем копию config_data, чтобы не изменять исходный файл
+        additions = {item["key"]: item["value"] for item in delta_data["additions"]}
+        updates = {item["key"]: item["to"] for item in delta_data["updates"]}
 
+        # Исходная конфигурация хранится в объекте, поэтому результат собирается слиянием словарей
+        # без ее изменения. Дельта не содержит ключей, которые одновременно удалены и добавлены,
+        # поэтому удаление после слияния дает тот же результат
+        res_patched_config = {**self.config_data, **additions, **updates}
         for key in delta_data["deletions"]:
-            if key in res_patched_config:
-                del res_patched_config[key]
-
-        # Применяем добавления и обновления
-        for item in delta_data["additions"]:
-            res_patched_config[item["key"]] = item["value"]
-        for item in delta_data["updates"]:
-            res_patched_config[item["key"]] = item["to"]
+            res_patched_config.pop(key, None)
 
         try:
-            with open(output_file, "w") as f:
-                json.dump(res_patched_config, f, indent=4)
+            _write_file(output_file, (_json_dumps(res_patched_config),), self._out_buf)
             print(f"res_patched_config.json сгенерирован успешно.")
         except IOError:
             print(f"Ошибка: Не удалось записать в файл '{output_file}'.")
@@ -330,6 +595,11 @@ def main():
 
     generator.generate_config_xml()  # Генерируем config.xml
     generator.generate_meta_json()  # Генерируем meta.json
+
+    if not generator.load_configs():  # Конфигурации читаются один раз для delta.json и res_patched_config.json
+        print("Не удалось загрузить конфигурации. Выход.")
+        return
+
     generator.generate_delta_json()  # Генерируем delta.json
     generator.generate_res_patched_config_json()  # Генерируем res_patched_config.json
 